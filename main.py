@@ -1,10 +1,17 @@
 import logging  # Used to record events and errors during the execution of a program
-import arxivscraper
-import pandas as pd
-import json
-from openai import OpenAI
+import asyncio
+import contextlib
+import hashlib
+import io
+import xml.etree.ElementTree as ET
+from urllib import robotparser
+import httpx
+from aioconsole import ainput
+import orjson
+from openai import AsyncOpenAI, NotFoundError
 import time
 import os
+import threading
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)  # Configure the logging module to record INFO-level messages and above
@@ -13,49 +20,313 @@ logger = logging.getLogger(__name__)  # Create a logger object for the current m
 api_key = os.getenv("OPENAI_API_KEY")
 logger.info("THIS_IS_THE_KEY: %s", api_key)
 
-client = OpenAI(api_key=api_key)
+# One client for the whole program so every SDK call shares the same keep-alive connection pool
+client = AsyncOpenAI(
+    api_key=api_key,
+    http_client=httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+    )
+)
+
+ASSISTANT_INSTRUCTIONS = """
+    You are an intelligent and helpful research assistant. Your name is {name}. You will work with the user to
+    help them learn new updates on AI advancements from data within a text file that holds one JSON paper record
+    per line. You will analyze the file, find the most relevant papers to the user's learning request, and output
+    a summary of the articles and their importance in one message.
+    Always output the links to the papers after you summarize them.
+"""
+
+ARXIV_DIR = "ARXIV"
+# NDJSON, but with a .txt extension since retrieval does not index .jsonl files
+ARXIV_DATA = os.path.join(ARXIV_DIR, "arxiv_data.txt")
+# Earlier dump names, removed so upload_file doesn't attach stale data next to the new dump
+LEGACY_ARXIV_DATA = (os.path.join(ARXIV_DIR, "arxiv_data.json"), os.path.join(ARXIV_DIR, "arxiv_data.jsonl"))
+SESSIONS_FILE = "arxiv_sessions.jsonl"
+
+# arXiv's OAI-PMH interface is the supported way to harvest metadata in bulk
+ARXIV_OAI_URL = "https://export.arxiv.org/oai2"
+ARXIV_ROBOTS_URL = "https://export.arxiv.org/robots.txt"
+USER_AGENT = "arxiv-gpt/1.0 (+https://github.com/Jaketa-CS/research_assistant_GenAI)"
+OAI_NS = "{http://www.openarchives.org/OAI/2.0/}"
+ARXIV_NS = "{http://arxiv.org/OAI/arXiv/}"
+MAX_RETRIES = 5
+ROBOTS_RECHECK_EVERY = 10  # Pages fetched between robots.txt checks
+MAX_UPLOAD_WORKERS = 8
+UPLOAD_MANIFEST = ".upload_cache.json"  # sha256 -> OpenAI file ID of files already uploaded
+POLL_INITIAL_DELAY = 0.25  # Seconds before the first run status check
+POLL_MAX_DELAY = 4.0
+
+
+def _robots_rules(session):
+    """
+    Read arXiv's robots.txt rules for our user agent.
 
+    Args:
+        session (httpx.Client): Shared arXiv HTTP client.
 
-def scrape_ai(start_date, end_date, category='cs.AI'):
+    Returns:
+        tuple: Whether OAI-PMH harvesting is allowed, and the crawl delay in seconds.
+    """
+    response = session.get(ARXIV_ROBOTS_URL)
+    parser = robotparser.RobotFileParser()
+    # Same rules as RobotFileParser.read(): auth errors forbid everything, a missing file allows everything
+    if response.status_code in (401, 403):
+        parser.disallow_all = True
+    else:
+        parser.parse(response.text.splitlines() if response.status_code == 200 else [])
+    return parser.can_fetch(USER_AGENT, ARXIV_OAI_URL), float(parser.crawl_delay(USER_AGENT) or 0)
+
+
+def _pause(stop, seconds):
+    """
+    Wait between arXiv requests, giving up early if the harvest is cancelled.
+
+    Args:
+        stop (threading.Event): Set to cancel the harvest.
+        seconds (float): How long to wait.
+
+    Returns:
+        None
+    """
+    if stop.wait(seconds):
+        raise RuntimeError("arXiv harvest cancelled")
+
+
+def _fetch_oai_page(session, params, stop):
+    """
+    Fetch one OAI-PMH page, backing off when arXiv throttles us or errors out.
+
+    Args:
+        session (httpx.Client): Shared arXiv HTTP client.
+        params (dict): Query parameters for the OAI-PMH request.
+        stop (threading.Event): Set to cancel the harvest.
+
+    Returns:
+        bytes: Raw XML response body.
+    """
+    delay = 1
+    for _ in range(MAX_RETRIES):
+        try:
+            response = session.get(ARXIV_OAI_URL, params=params)
+        except httpx.TransportError as e:
+            logger.info("arXiv request failed (%s), retrying in %s seconds", str(e), delay)
+            _pause(stop, delay)
+            delay *= 2
+            continue
+        if response.status_code == 429 or response.status_code >= 500:
+            retry_after = response.headers.get("Retry-After", "")
+            wait = int(retry_after) if retry_after.isdigit() else delay
+            logger.info("arXiv returned %s, retrying in %s seconds", response.status_code, wait)
+            _pause(stop, wait)
+            delay *= 2
+            continue
+        response.raise_for_status()
+        return response.content
+    raise RuntimeError(f"arXiv OAI-PMH still unavailable after {MAX_RETRIES} attempts")
+
+
+def _record_to_dict(metadata):
+    """
+    Convert an arXiv metadata element into a paper record.
+
+    Args:
+        metadata (Element): <arXiv> metadata element from an OAI-PMH record.
+
+    Returns:
+        dict: Paper record.
+    """
+    arxiv_id = metadata.findtext(ARXIV_NS + "id")
+    authors = []
+    for author in metadata.iter(ARXIV_NS + "author"):
+        names = (author.findtext(ARXIV_NS + "forenames"), author.findtext(ARXIV_NS + "keyname"))
+        authors.append(" ".join(name for name in names if name))
+
+    return {
+        'id': arxiv_id,
+        'title': " ".join(metadata.findtext(ARXIV_NS + "title", "").split()),
+        'abstract': " ".join(metadata.findtext(ARXIV_NS + "abstract", "").split()),
+        'doi': metadata.findtext(ARXIV_NS + "doi"),
+        'created': metadata.findtext(ARXIV_NS + "created"),
+        'url': "https://arxiv.org/abs/" + arxiv_id,
+        'authors': authors
+    }
+
+
+def _parse_oai_page(content, category):
+    """
+    Stream-parse an OAI-PMH ListRecords page.
+
+    Args:
+        content (bytes): Raw XML response body.
+        category (str): arXiv category the records must belong to.
+
+    Returns:
+        tuple: List of paper records and the resumption token (None on the last page).
+    """
+    records, token = [], None
+    for _, elem in ET.iterparse(io.BytesIO(content)):
+        if elem.tag == OAI_NS + "record":
+            metadata = elem.find(f"{OAI_NS}metadata/{ARXIV_NS}arXiv")
+            if (metadata is not None and metadata.findtext(ARXIV_NS + "id")
+                    and category in metadata.findtext(ARXIV_NS + "categories", "").split()):
+                records.append(_record_to_dict(metadata))
+            elem.clear()
+        elif elem.tag == OAI_NS + "resumptionToken":
+            token = elem.text or None
+        elif elem.tag == OAI_NS + "error" and elem.get("code") != "noRecordsMatch":
+            raise RuntimeError(f"arXiv OAI-PMH error {elem.get('code')}: {elem.text}")
+    return records, token
+
+
+def _iter_arxiv_records(start_date, end_date, category, stop):
+    """
+    Yield arXiv paper records for a date range, following resumption tokens.
+
+    Args:
+        start_date (str): Start date in YYYY-MM-DD format.
+        end_date (str): End date in YYYY-MM-DD format.
+        category (str): arXiv category.
+        stop (threading.Event): Set to cancel the harvest between requests.
+
+    Yields:
+        dict: Paper record.
+    """
+    params = {
+        "verb": "ListRecords",
+        "metadataPrefix": "arXiv",
+        "set": category.split('.')[0],
+        "from": start_date,
+        "until": end_date
+    }
+    pages = 0
+    crawl_delay = 0.0
+    next_request = 0.0
+
+    def wait_turn(request):
+        # Space out every request on the session, including robots.txt checks and retries,
+        # by the crawl delay arXiv asks for
+        nonlocal next_request
+        _pause(stop, max(next_request - time.monotonic(), 0))
+        next_request = time.monotonic() + crawl_delay
+
+    def mark_done(response):
+        nonlocal next_request
+        next_request = time.monotonic() + crawl_delay
+
+    # One keep-alive client for every page, so TCP and TLS setup happen once per scrape
+    with httpx.Client(http2=True, headers={"User-Agent": USER_AGENT}, timeout=30.0,
+                      event_hooks={"request": [wait_turn], "response": [mark_done]}) as session:
+        while params:
+            if pages % ROBOTS_RECHECK_EVERY == 0:
+                allowed, crawl_delay = _robots_rules(session)
+                if not allowed:
+                    raise RuntimeError("arXiv robots.txt disallows OAI-PMH harvesting")
+                # The robots.txt response finished before we knew the delay, so apply it now
+                next_request = time.monotonic() + crawl_delay
+
+            records, token = _parse_oai_page(_fetch_oai_page(session, params, stop), category)
+            pages += 1
+            yield from records
+            params = {"verb": "ListRecords", "resumptionToken": token} if token else None
+
+
+def scrape_ai(start_date, end_date, category='cs.AI', stop=None):
     """
     Scrape arXiv data based on the specified date range and category.
-    Save the data to a JSON file.
+    Stream the records to a JSON Lines file as they arrive, replacing the previous dump only
+    once the whole harvest has succeeded.
 
     Args:
         start_date (str): Start date in YYYY-MM-DD format.
         end_date (str): End date in YYYY-MM-DD format.
         category (str): arXiv category.
+        stop (threading.Event): Set from another thread to cancel the harvest.
 
     Returns:
         None
     """
-    folder = "ARXIV"
-    if not os.path.exists(folder):
-        os.makedirs(folder)
+    if stop is None:
+        stop = threading.Event()
+    os.makedirs(ARXIV_DIR, exist_ok=True)
+    tmp_path = ARXIV_DATA + ".tmp"
 
     try:
-        scraper = arxivscraper.Scraper(category=category, date_from=start_date, date_until=end_date,
-                                       filters={'categories': ['cs.AI']})
-        output = scraper.scrape()
-
-        if not output:
-            logger.warning("No data retrieved from the arXiv scraper.")
-            return
-
         cols = ('id', 'title', 'abstract', 'doi', 'created', 'url', 'authors')
-        df = pd.DataFrame(output, columns=cols)
-        json_data = df.to_json(orient='records')
-        formatted_json = json.loads(json_data)
-        with open('ARXIV/arxiv_data.json', 'w') as file:
-            json.dump(formatted_json, file, indent=4)
+        count = 0
+        with open(tmp_path, 'wb') as file:
+            for record in _iter_arxiv_records(start_date, end_date, category, stop):
+                # Leave out missing fields (most papers have no DOI) to keep the upload small
+                row = {col: record[col] for col in cols if record.get(col) is not None}
+                file.write(orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE))
+                count += 1
+
+        if count:
+            os.replace(tmp_path, ARXIV_DATA)
+            for legacy_path in LEGACY_ARXIV_DATA:
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(legacy_path)
+        else:
+            logger.warning("No data retrieved from arXiv.")
     except Exception as e:
         logger.error("Error during scraping: %s", str(e))
+    finally:
+        # Drop a partial or empty harvest so the previous dump stays in place
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_path)
+
+
+
+async def _upload_one(assistant_id, file_path, manifest):
+    """
+    Upload a single file to OpenAI and associate it with the assistant.
+    Files whose content was uploaded before reuse the existing file ID, unless OpenAI
+    no longer has that file, in which case it is uploaded again.
 
+    Args:
+        assistant_id (str): Assistant ID.
+        file_path (str): Path of the file to upload.
+        manifest (dict): Content hash to file ID mapping, updated in place.
 
+    Returns:
+        str: File ID.
+    """
+    with open(file_path, "rb") as file:
+        digest = hashlib.file_digest(file, "sha256").hexdigest()
+        file_id = manifest.get(digest)
+
+        if file_id:
+            try:
+                await client.beta.assistants.files.create(
+                    assistant_id=assistant_id,
+                    file_id=file_id
+                )
+                return file_id
+            except NotFoundError:
+                # The cached file was deleted or belongs to another organization
+                logger.info("Cached file %s for %s no longer exists, uploading again", file_id, file_path)
+                manifest.pop(digest, None)
+
+        file.seek(0)
+        response = await client.files.create(
+            file=file,
+            purpose="assistants"
+        )
+        file_id = response.id
+        manifest[digest] = file_id
 
-def upload_file(assistant_id, folder='ARXIV'):
+    if file_id:
+        await client.beta.assistants.files.create(
+            assistant_id=assistant_id,
+            file_id=file_id
+        )
+    return file_id
+
+
+async def upload_file(assistant_id, folder=ARXIV_DIR):
     """
     Upload files from the specified folder to OpenAI and associate them with the assistant.
+    Uploads run concurrently since each one is dominated by network latency.
 
     Args:
         assistant_id (str): Assistant ID.
@@ -65,37 +336,52 @@ def upload_file(assistant_id, folder='ARXIV'):
         list: List of file IDs.
     """
     file_ids = []
+    manifest_path = os.path.join(folder, UPLOAD_MANIFEST)
 
     try:
-        for filename in os.listdir(folder):
-            file_path = os.path.join(folder, filename)
-
-            if os.path.isfile(file_path) and os.path.getsize(file_path) > 0:
-                response = client.files.create(
-                    file=open(file_path, "rb"),
-                    purpose="assistants"
-                )
-
-                file_id = response.id
-
-                if file_id:
-                    assistant_file = client.beta.assistants.files.create(
-                        assistant_id=assistant_id,
-                        file_id=file_id
-                    )
-                    file_ids.append(file_id)
+        try:
+            with open(manifest_path, 'rb') as file:
+                manifest = orjson.loads(file.read())
+        except FileNotFoundError:
+            manifest = {}
+        except orjson.JSONDecodeError:
+            logger.warning("Ignoring corrupt upload manifest %s", manifest_path)
+            manifest = {}
+
+        # DirEntry caches its stat result, so type and size checks share one syscall
+        with os.scandir(folder) as entries:
+            paths = [entry.path for entry in entries
+                     if not entry.name.startswith('.')
+                     and entry.is_file(follow_symlinks=False) and entry.stat().st_size > 0]
+
+        semaphore = asyncio.Semaphore(MAX_UPLOAD_WORKERS)
+
+        async def upload(path):
+            async with semaphore:
+                return await _upload_one(assistant_id, path, manifest)
+
+        results = await asyncio.gather(*(upload(path) for path in paths), return_exceptions=True)
+        for path, result in zip(paths, results):
+            if isinstance(result, Exception):
+                logger.error("Error uploading %s: %s", path, str(result))
+            elif result:
+                file_ids.append(result)
+
+        # Write then rename, so a crash can never leave a truncated manifest behind
+        with open(manifest_path + ".tmp", 'wb') as file:
+            file.write(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+        os.replace(manifest_path + ".tmp", manifest_path)
     except Exception as e:
         logger.error("Error during file upload: %s", str(e))
 
     return file_ids
 
 
-def setup_assistant(client, assistant_name, model="gpt-3.5-turbo-1106"):
+async def setup_assistant(assistant_name, model="gpt-3.5-turbo-1106"):
     """
     Create a new assistant.
 
     Args:
-        client: OpenAI client.
         assistant_name (str): Name for the assistant.
         model (str): OpenAI model to use.
 
@@ -103,30 +389,24 @@ def setup_assistant(client, assistant_name, model="gpt-3.5-turbo-1106"):
         tuple: Assistant ID and Thread ID.
     """
     try:
-        assistant = client.beta.assistants.create(
+        assistant = await client.beta.assistants.create(
             name=assistant_name,
-            instructions=f"""
-                You are an intelligent and helpful research assistant. Your name is {assistant_name}. You will work with the user to
-                help them learn new updates on AI advancements from data within a json file. You will analyze the json file,
-                find the most relevant papers to the user's learning request, and output a summary of the articles and their importance in one message. 
-                Always output the links to the papers after you summarize them.
-            """,
+            instructions=ASSISTANT_INSTRUCTIONS.format(name=assistant_name),
             model=model,
             tools=[{"type": "retrieval"}, {"type": "code_interpreter"}]
         )
-        thread = client.beta.threads.create()
+        thread = await client.beta.threads.create()
         return assistant.id, thread.id
     except Exception as e:
         logger.error("Error during assistant setup: %s", str(e))
         return None, None
 
 
-def send_message(client, thread_id, task, file_ids):
+async def send_message(thread_id, task, file_ids):
     """
     Send a message to the assistant.
 
     Args:
-        client: OpenAI client.
         thread_id (str): Thread ID.
         task (str): Task content.
         file_ids (list): List of file IDs.
@@ -135,7 +415,7 @@ def send_message(client, thread_id, task, file_ids):
         dict: Thread message details.
     """
     try:
-        thread_message = client.beta.threads.messages.create(
+        thread_message = await client.beta.threads.messages.create(
             thread_id,
             role="user",
             content=task,
@@ -147,12 +427,11 @@ def send_message(client, thread_id, task, file_ids):
         return None
 
 
-def run_assistant(client, assistant_id, thread_id):
+async def run_assistant(assistant_id, thread_id):
     """
     Run the assistant.
 
     Args:
-        client: OpenAI client.
         assistant_id (str): Assistant ID.
         thread_id (str): Thread ID.
 
@@ -160,30 +439,104 @@ def run_assistant(client, assistant_id, thread_id):
         list: List of thread messages.
     """
     try:
-        run = client.beta.threads.runs.create(
+        run = await client.beta.threads.runs.create(
             thread_id=thread_id,
             assistant_id=assistant_id
         )
 
+        # Poll quickly at first so short runs return fast, then back off for long ones
+        delay = POLL_INITIAL_DELAY
         while run.status == "in_progress" or run.status == "queued":
-            time.sleep(1)
-            run = client.beta.threads.runs.retrieve(
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, POLL_MAX_DELAY)
+            run = await client.beta.threads.runs.retrieve(
                 thread_id=thread_id,
                 run_id=run.id
             )
 
         if run.status == "completed":
-            return client.beta.threads.messages.list(
-                thread_id=thread_id
+            # Only the newest message is the reply to this run
+            return await client.beta.threads.messages.list(
+                thread_id=thread_id,
+                limit=1,
+                order="desc"
             )
     except Exception as e:
         logger.error("Error during assistant run: %s", str(e))
         return None
 
 
-def save_session(assistant_id, thread_id, user_name_input, file_ids, file_path='arxiv_sessions.json'):
+_session_cache = {}  # (path, mtime, size) -> parsed sessions
+
+
+def _migrate_sessions(file_path):
     """
-    Save the current session details to a file.
+    Convert sessions saved by older versions, which kept every session in one JSON
+    object in a .json file, into the JSON Lines file. Runs once; the old file is
+    renamed to .json.bak afterwards.
+
+    Args:
+        file_path (str): JSON Lines sessions file path.
+
+    Returns:
+        None
+    """
+    legacy_path = os.path.splitext(file_path)[0] + ".json"
+    try:
+        with open(legacy_path, 'rb') as file:
+            sessions = orjson.loads(file.read())["sessions"]
+    except FileNotFoundError:
+        return
+
+    try:
+        # 'x' mode refuses to overwrite sessions already saved in the new format
+        with open(file_path, 'xb') as file:
+            for number in sorted(sessions, key=int):
+                file.write(orjson.dumps(sessions[number], option=orjson.OPT_APPEND_NEWLINE))
+    except FileExistsError:
+        logger.warning("Not migrating %s because %s already exists", legacy_path, file_path)
+        return
+
+    os.replace(legacy_path, legacy_path + ".bak")
+    logger.info("Migrated sessions from %s to %s", legacy_path, file_path)
+
+
+def _read_sessions(file_path):
+    """
+    Read saved sessions from a JSON Lines file, one session per line.
+
+    Args:
+        file_path (str): File path.
+
+    Returns:
+        dict: Sessions keyed by session number (their line number in the file).
+        Lines that fail to parse, such as one cut short by a crash, are skipped.
+    """
+    # Only re-parse when the file has changed since the last read
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
+        _migrate_sessions(file_path)
+        stat = os.stat(file_path)
+    key = (file_path, stat.st_mtime_ns, stat.st_size)
+    sessions = _session_cache.get(key)
+    if sessions is None:
+        sessions = {}
+        with open(file_path, 'rb') as file:
+            lines = (line for line in file if line.strip())
+            for number, line in enumerate(lines, start=1):
+                try:
+                    sessions[str(number)] = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    logger.warning("Skipping unreadable session %s in %s", number, file_path)
+        _session_cache.clear()
+        _session_cache[key] = sessions
+    return sessions
+
+
+def save_session(assistant_id, thread_id, user_name_input, file_ids, file_path=SESSIONS_FILE):
+    """
+    Save the current session details by appending them to the sessions file.
 
     Args:
         assistant_id (str): Assistant ID.
@@ -196,28 +549,26 @@ def save_session(assistant_id, thread_id, user_name_input, file_ids, file_path='
         None
     """
     try:
-        if os.path.exists(file_path):
-            with open(file_path, 'r') as file:
-                data = json.load(file)
-        else:
-            data = {"sessions": {}}
-
-        next_session_number = str(len(data["sessions"]) + 1)
-
-        data["sessions"][next_session_number] = {
+        session = {
             "Assistant ID": assistant_id,
             "Thread ID": thread_id,
             "User Name Input": user_name_input,
             "File IDs": file_ids
         }
 
-        with open(file_path, 'w') as file:
-            json.dump(data, file, indent=4)
+        _migrate_sessions(file_path)
+        with open(file_path, 'a+b') as file:
+            # Start on a fresh line if the previous append was cut short
+            if file.seek(0, os.SEEK_END):
+                file.seek(-1, os.SEEK_END)
+                if file.read(1) != b'\n':
+                    file.write(b'\n')
+            file.write(orjson.dumps(session, option=orjson.OPT_APPEND_NEWLINE))
     except Exception as e:
         logger.error("Error during saving session: %s", str(e))
 
 
-def display_sessions(file_path='arxiv_sessions.json'):
+def display_sessions(file_path=SESSIONS_FILE):
     """
     Display available sessions.
 
@@ -228,21 +579,20 @@ def display_sessions(file_path='arxiv_sessions.json'):
         None
     """
     try:
-        if not os.path.exists(file_path):
+        try:
+            sessions = _read_sessions(file_path)
+        except FileNotFoundError:
             print("No sessions available.")
             return
 
-        with open(file_path, 'r') as file:
-            data = json.load(file)
-
         print("Available Sessions:")
-        for number, session in data["sessions"].items():
+        for number, session in sessions.items():
             print(f"Session {number}: {session['User Name Input']}")
     except Exception as e:
         logger.error("Error during displaying sessions: %s", str(e))
 
 
-def get_session_data(session_number, file_path='arxiv_sessions.json'):
+def get_session_data(session_number, file_path=SESSIONS_FILE):
     """
     Get session data based on the session number.
 
@@ -254,10 +604,7 @@ def get_session_data(session_number, file_path='arxiv_sessions.json'):
         tuple: Assistant ID, Thread ID, User Name Input, and File IDs.
     """
     try:
-        with open(file_path, 'r') as file:
-            data = json.load(file)
-
-        session = data["sessions"].get(session_number)
+        session = _read_sessions(file_path).get(session_number)
         if session:
             return session["Assistant ID"], session["Thread ID"], session["User Name Input"], session["File IDs"]
         else:
@@ -268,12 +615,11 @@ def get_session_data(session_number, file_path='arxiv_sessions.json'):
         return None, None
 
 
-def collect_message_history(assistant_id, thread_id, user_name_input):
+async def collect_message_history(thread_id, user_name_input):
     """
     Collect and save message history to a file.
 
     Args:
-        assistant_id (str): Assistant ID.
         thread_id (str): Thread ID.
         user_name_input (str): User name input.
 
@@ -281,19 +627,26 @@ def collect_message_history(assistant_id, thread_id, user_name_input):
         str: Message log information.
     """
     try:
-        messages = run_assistant(client, assistant_id, thread_id)
-        message_dict = json.loads(messages.model_dump_json())
+        messages = await client.beta.threads.messages.list(
+            thread_id=thread_id,
+            limit=100,
+            order="asc"
+        )
 
-        with open(f'{user_name_input}_message_log.txt', 'w') as message_log:
-            for message in reversed(message_dict['data']):
-                text_value = message['content'][0]['text']['value']
+        prefix_user = "You: "
+        prefix_assistant = f"{user_name_input}: "
+        lines = []
 
-                if message['role'] == 'assistant':
-                    prefix = f"{user_name_input}: "
-                else:
-                    prefix = "You: "
+        # Each page is fetched with an "after" cursor from the previous one
+        async for page in messages.iter_pages():
+            lines.extend(
+                (prefix_assistant if message.role == 'assistant' else prefix_user)
+                + message.content[0].text.value + '\n'
+                for message in page.data
+            )
 
-                message_log.write(prefix + text_value + '\n')
+        with open(f'{user_name_input}_message_log.txt', 'w') as message_log:
+            message_log.writelines(lines)
 
         return f"Messages saved to {user_name_input}_message_log.txt"
     except Exception as e:
@@ -301,40 +654,53 @@ def collect_message_history(assistant_id, thread_id, user_name_input):
         return "Error collecting message history."
 
 
-def main_loop():
+async def main_loop():
     try:
         print("\n------------------------------ Welcome to Arxiv GPT! ------------------------------\n")
-        user_choice = input("Type 'n' to make a new agent. Press 'Enter' to choose an existing session. ")
+        # ainput reads stdin on the event loop, so Ctrl-C can cancel a prompt
+        user_choice = await ainput("Type 'n' to make a new agent. Press 'Enter' to choose an existing session. ")
         if user_choice == 'n':
-            scrape_ai(start_date='2023-12-16', end_date='2023-12-16')  # Adjust to today's date
-            user_name_input = input("Type a Name for this Assistant (usually today's date is best): ")
-            IDS = setup_assistant(client, assistant_name=user_name_input)
+            user_name_input = await ainput("Type a Name for this Assistant (usually today's date is best): ")
+            # Scraping and assistant creation are independent, so let them overlap
+            stop_scrape = threading.Event()
+            try:
+                _, IDS = await asyncio.gather(
+                    asyncio.to_thread(scrape_ai, start_date='2023-12-16', end_date='2023-12-16',  # Adjust to today's date
+                                      stop=stop_scrape),
+                    setup_assistant(assistant_name=user_name_input)
+                )
+            except asyncio.CancelledError:
+                # The scrape thread can't be cancelled directly; tell it to stop at its next wait
+                stop_scrape.set()
+                raise
             assistant_id, thread_id, file_ids = IDS[0], IDS[1], []
-            file_ids.extend(upload_file(assistant_id))
+            file_ids.extend(await upload_file(assistant_id))
             save_session(assistant_id, thread_id, user_name_input, file_ids)
             logger.info(f"Created Session with {user_name_input}, Assistant ID: {assistant_id} and Thread ID: {thread_id}\n"
                         f"Please tell the assistant what specific subject you want to focus on.")
         else:
             display_sessions()
-            chosen_session_number = input("Enter the session number to load: ")
+            chosen_session_number = await ainput("Enter the session number to load: ")
             assistant_id, thread_id, user_name_input, file_ids = get_session_data(chosen_session_number)
             logger.info(f"Started a new session with {user_name_input}, Assistant ID: {assistant_id} and Thread ID: {thread_id}")
         if assistant_id and thread_id:
             while True:
-                user_message = input("You: ")
+                user_message = await ainput("You: ")
                 if user_message.lower() in {'exit', 'exit.'}:
                     print("Exiting the program.")
-                    print(collect_message_history(assistant_id, thread_id, user_name_input))
+                    print(await collect_message_history(thread_id, user_name_input))
                     break
-                send_message(client, thread_id, user_message, file_ids)
-                messages = run_assistant(client, assistant_id, thread_id)
-                message_dict = json.loads(messages.model_dump_json())
-                most_recent_message = message_dict['data'][0]
-                assistant_message = most_recent_message['content'][0]['text']['value']
+                await send_message(thread_id, user_message, file_ids)
+                messages = await run_assistant(assistant_id, thread_id)
+                most_recent_message = messages.data[0]
+                assistant_message = most_recent_message.content[0].text.value
                 print(f"{user_name_input}: {assistant_message}")
     except Exception as e:
         logger.error("Error in main loop: %s", str(e))
+    finally:
+        # Close the shared HTTP/2 connections before the event loop shuts down
+        await client.close()
 
 
 if __name__ == "__main__":
-    main_loop()
+    asyncio.run(main_loop())